@@ -646,7 +646,112 @@ class MemoryAnalyzer:
         # Speichere Ergebnisse
         self._save_test_results('image_memory_management.json', image_test_results)
         return image_test_results
-    
+
+    def test_image_decode_strategies(self, iterations: int = 5):
+        """Test 3b: Vollständiges Decoding vs. JPEG-Draft-Decoding für Thumbnails"""
+        logger.info("=== TEST 3b: Image-Decode-Strategien ===")
+
+        decode_results = {
+            'iterations': iterations,
+            'decode_strategies': {}
+        }
+
+        try:
+            from PIL import Image, ImageDraw
+
+            temp_images_dir = self.test_results_dir / "test_decode_images"
+            temp_images_dir.mkdir(exist_ok=True)
+
+            # Gleiche Größen wie in test_image_memory_management
+            image_sizes = [(800, 600), (1920, 1080), (3840, 2160)]
+            thumbnail_sizes = [(150, 150), (300, 300), (800, 600)]
+
+            def decode_thumbnail(image_path: Path, size: Tuple[int, int], use_draft: bool) -> int:
+                """Erstellt ein Thumbnail und liefert die Anzahl dekodierter Pixel"""
+                with Image.open(image_path) as img:
+                    if use_draft:
+                        # DCT-Skalierung: dekodiert nur die nötige Auflösung (>= size)
+                        img.draft('RGB', size)
+                    img.load()
+                    decoded_pixels = img.width * img.height
+                    thumb = img.copy()
+                thumb.thumbnail(size, Image.Resampling.LANCZOS)
+                del thumb
+                return decoded_pixels
+
+            for width, height in image_sizes:
+                image_path = temp_images_dir / f"decode_{width}x{height}.jpg"
+
+                # Test-Bild analog zu test_image_memory_management erzeugen
+                img = Image.new('RGB', (width, height), color='blue')
+                draw = ImageDraw.Draw(img)
+                for i in range(100):
+                    x1, y1 = i * 10 % width, i * 15 % height
+                    draw.rectangle([x1, y1, x1 + 50, y1 + 30], fill='red')
+                img.save(image_path, 'JPEG', quality=85)
+                del img
+                del draw
+
+                size_results = {}
+
+                for thumb_width, thumb_height in thumbnail_sizes:
+                    strategy_results = {}
+
+                    for strategy, use_draft in (('full_decode', False), ('draft_decode', True)):
+                        gc.collect()
+                        start_memory = self.take_memory_snapshot()
+                        durations_ms = []
+                        decoded_pixels = 0
+
+                        for _ in range(iterations):
+                            start_time = time.perf_counter()
+                            decoded_pixels = decode_thumbnail(image_path, (thumb_width, thumb_height), use_draft)
+                            durations_ms.append((time.perf_counter() - start_time) * 1000)
+
+                        end_memory = self.take_memory_snapshot()
+
+                        strategy_results[strategy] = {
+                            'avg_duration_ms': sum(durations_ms) / len(durations_ms),
+                            'min_duration_ms': min(durations_ms),
+                            'decoded_pixels': decoded_pixels,
+                            'decoded_rgb_mb': decoded_pixels * 3 / (1024 * 1024),
+                            'memory_increase_mb': end_memory.rss_mb - start_memory.rss_mb
+                        }
+
+                    full = strategy_results['full_decode']
+                    draft = strategy_results['draft_decode']
+                    strategy_results['speedup'] = (
+                        full['avg_duration_ms'] / draft['avg_duration_ms'] if draft['avg_duration_ms'] > 0 else 0
+                    )
+                    strategy_results['decoded_pixel_reduction'] = (
+                        full['decoded_pixels'] / draft['decoded_pixels'] if draft['decoded_pixels'] > 0 else 0
+                    )
+
+                    size_results[f"{thumb_width}x{thumb_height}"] = strategy_results
+
+                    logger.info(
+                        f"Decode {width}x{height} -> {thumb_width}x{thumb_height}: "
+                        f"full {full['avg_duration_ms']:.2f}ms / {full['decoded_rgb_mb']:.2f}MB, "
+                        f"draft {draft['avg_duration_ms']:.2f}ms / {draft['decoded_rgb_mb']:.2f}MB"
+                    )
+
+                decode_results['decode_strategies'][f"{width}x{height}"] = size_results
+
+        except ImportError:
+            logger.warning("PIL not available - skipping decode strategy tests")
+            decode_results['error'] = 'PIL not available'
+        except Exception as e:
+            logger.error(f"Image decode strategy test error: {e}")
+            decode_results['error'] = str(e)
+        finally:
+            temp_images_dir = self.test_results_dir / "test_decode_images"
+            if temp_images_dir.exists():
+                shutil.rmtree(temp_images_dir, ignore_errors=True)
+
+        # Speichere Ergebnisse
+        self._save_test_results('image_decode_strategies.json', decode_results)
+        return decode_results
+
     def test_database_connection_pooling(self):
         """Test 4: Database-Connection-Pooling und Cleanup"""
         logger.info("=== TEST 4: Database-Connection-Pooling ===")
@@ -1224,7 +1329,10 @@ class MemoryAnalyzer:
             
             # Test 3: Image-Memory-Management
             test_results['image_memory_management'] = self.test_image_memory_management()
-            
+
+            # Test 3b: Image-Decode-Strategien (Full vs. Draft)
+            test_results['image_decode_strategies'] = self.test_image_decode_strategies()
+
             # Test 4: Database-Connection-Pooling
             test_results['database_connection_pooling'] = self.test_database_connection_pooling()
             